@@ -0,0 +1,159 @@
+"""Compare the HTML parser backends on saved pages: parity with html.parser
+and throughput/peak memory per backend.
+
+Parity checks the crawler-visible outcome of every page (affiliate verdict,
+keywords, internal links, anchor texts, emails, title) on the bundled
+fixtures plus the benchmark pages. Each backend is timed in its own
+subprocess so that its peak RSS is not mixed with the others'; memory is
+reported against a control subprocess that loads the same pages without
+parsing them.
+
+Usage: python benchmarks/bench_html_parsers.py [--pages-dir crawled_sites] [--rounds 5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bench_keyword_matching import FIXTURES_DIR, load_pages, offline_crawler, synthetic_pages
+
+from better_affiliate_crawler import PARSER_BACKENDS
+
+REFERENCE = 'html.parser'
+CONTROL = 'none'
+
+
+def peak_rss_mb():
+    # On Linux ru_maxrss survives execve, so a child would start at the parent's
+    # peak; VmHWM belongs to the new address space.
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        import psutil
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def get_pages(pages_dir):
+    pages = load_pages(pages_dir) if os.path.isdir(pages_dir) else []
+    if pages:
+        return pages, pages_dir
+    return synthetic_pages(), "synthetic pages"
+
+
+def outcome(crawler, url, features):
+    is_affiliate, keywords = crawler._check_affiliate_indicators(url, features)
+    return {
+        'affiliate': is_affiliate,
+        'keywords': sorted(keyword.strip() for keyword in keywords),
+        'links': sorted(crawler._get_internal_links(features, url)),
+        # Whitespace-insensitive: parsers disagree on inter-element whitespace only
+        'anchors': [(link.href, " ".join(link.text.split()), link.region) for link in features.links],
+        'emails': sorted(crawler._extract_page_emails(features)),
+        'title': features.title,
+    }
+
+
+def check_parity(pages, backends):
+    crawler = offline_crawler()
+    reference = PARSER_BACKENDS[REFERENCE]
+    mismatches = {name: {} for name in backends}
+    for i, html in enumerate(pages):
+        url = f"https://example.com/page{i}"
+        expected = outcome(crawler, url, reference(html))
+        for name in backends:
+            actual = outcome(crawler, url, PARSER_BACKENDS[name](html))
+            for key in expected:
+                if actual[key] != expected[key]:
+                    mismatches[name][key] = mismatches[name].get(key, 0) + 1
+    return mismatches
+
+
+def time_backend(name, pages_dir, rounds):
+    """Run in a subprocess: parse every page `rounds` times and report speed and peak RSS.
+
+    The control run (`name` == CONTROL) loads the pages and parses nothing.
+    """
+    pages, _ = get_pages(pages_dir)
+    parse = PARSER_BACKENDS.get(name, lambda html: None)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for html in pages:
+            parse(html)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        'pages_per_s': rounds * len(pages) / elapsed,
+        'peak_rss_mb': peak_rss_mb(),
+    }))
+
+
+def run_subprocess(name, args):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--only', name,
+         '--pages-dir', args.pages_dir, '--rounds', str(args.rounds)],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def available_backends():
+    names = []
+    for name, parse in PARSER_BACKENDS.items():
+        try:
+            parse("<html><body><a href='/x'>x</a></body></html>")
+        except ImportError:
+            print(f"  {name}: not installed, skipped")
+            continue
+        names.append(name)
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages-dir', default='crawled_sites', help="Directory of saved HTML pages (default: crawled_sites).")
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--only', choices=sorted(PARSER_BACKENDS) + [CONTROL], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.only:
+        time_backend(args.only, args.pages_dir, args.rounds)
+        return
+
+    pages, source = get_pages(args.pages_dir)
+    fixtures = load_pages(FIXTURES_DIR)
+    print(f"{len(pages)} page(s) from {source}, {len(fixtures)} fixture(s)")
+    backends = available_backends()
+
+    mismatches = check_parity(fixtures + pages, [name for name in backends if name != REFERENCE])
+    for name, diffs in mismatches.items():
+        detail = ", ".join(f"{key}: {count}" for key, count in sorted(diffs.items())) or "identical"
+        print(f"  parity {name} vs {REFERENCE}: {detail}")
+
+    control_mb = run_subprocess(CONTROL, args)['peak_rss_mb']
+    print(f"  control peak RSS {control_mb:.1f} MB (pages loaded, nothing parsed)")
+    for name in backends:
+        stats = run_subprocess(name, args)
+        print(
+            f"  {name:12s} {stats['pages_per_s']:8.1f} pages/s  "
+            f"peak RSS {stats['peak_rss_mb']:.1f} MB (+{stats['peak_rss_mb'] - control_mb:.1f} MB over control)"
+        )
+
+    if any(diffs.get('affiliate') for diffs in mismatches.values()):
+        raise SystemExit("Affiliate verdicts differ between backends")
+
+
+if __name__ == "__main__":
+    main()
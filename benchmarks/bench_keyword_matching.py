@@ -0,0 +1,133 @@
+"""Benchmark BetterAffiliateCrawler._check_affiliate_indicators against the
+former per-keyword substring scans, and check that both agree.
+
+The automaton timing covers matching only; page features are extracted
+once beforehand, as the crawler does.
+
+Usage: python benchmarks/bench_keyword_matching.py [--pages-dir crawled_sites] [--rounds 20]
+"""
+import argparse
+import atexit
+import glob
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from bs4 import BeautifulSoup
+
+import better_affiliate_crawler
+from better_affiliate_crawler import BetterAffiliateCrawler, extract_page_features
+
+
+def legacy_check(crawler, url, soup):
+    """The keyword scan as it was before the automaton (one pass per keyword)."""
+    keywords_found = set()
+    text_lower = soup.get_text().lower()
+    url_lower = url.lower()
+    has_link_keyword = False
+    for pattern in crawler.affiliate_keywords['url_patterns']:
+        if pattern in url_lower:
+            keywords_found.add(pattern)
+    all_content_keywords = [kw for kws in crawler.affiliate_keywords['content_keywords'].values() for kw in kws]
+    for a in soup.find_all('a'):
+        link_text = a.get_text().lower()
+        if any(keyword in link_text for keyword in all_content_keywords):
+            has_link_keyword = True
+            keywords_found.add(a.get_text().strip())
+    for keyword in all_content_keywords:
+        if keyword in text_lower:
+            keywords_found.add(keyword)
+    has_strong_indicator = any(
+        indicator in text_lower for indicator in crawler.affiliate_keywords['strong_indicators']
+    )
+    return has_strong_indicator or has_link_keyword or len(keywords_found) > 1, keywords_found
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def offline_crawler():
+    """A crawler used only for its matching helpers.
+
+    It is built in a throwaway directory so that its progress database and
+    results file (and the legacy progress migration) never touch the
+    current directory.
+    """
+    workdir = tempfile.mkdtemp(prefix="bench_crawler_")
+    atexit.register(shutil.rmtree, workdir, True)
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        return BetterAffiliateCrawler()
+    finally:
+        os.chdir(cwd)
+
+
+def synthetic_pages(count=20):
+    random.seed(42)
+    words = ("pricing features product team login sign up docs blog careers earn share our program "
+             "partner portal money affiliate referral about help changelog integrations").split()
+    pages = []
+    for _ in range(count):
+        paragraphs = "".join(
+            f"<p>{' '.join(random.choice(words) for _ in range(40))}</p>" for _ in range(150)
+        )
+        anchors = "".join(
+            f"<a href='/p{i}'>{' '.join(random.choice(words) for _ in range(3))}</a>" for i in range(300)
+        )
+        pages.append(f"<html><body><nav>{anchors}</nav>{paragraphs}</body></html>")
+    return pages
+
+
+def load_pages(pages_dir):
+    paths = sorted(glob.glob(os.path.join(pages_dir, "**", "*.html"), recursive=True))
+    pages = []
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            pages.append(f.read())
+    return pages
+
+
+def time_it(func, soups, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for url, soup in soups:
+            func(url, soup)
+    return (time.perf_counter() - start) / (rounds * len(soups)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages-dir', default='crawled_sites', help="Directory of saved HTML pages (default: crawled_sites).")
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages_dir) if os.path.isdir(args.pages_dir) else []
+    source = args.pages_dir
+    if not pages:
+        pages = synthetic_pages()
+        source = "synthetic pages"
+
+    crawler = offline_crawler()
+    soups = [(f"https://example.com/page{i}", BeautifulSoup(html, 'html.parser')) for i, html in enumerate(pages)]
+
+    features = [(url, extract_page_features(soup)) for url, soup in soups]
+    for (url, soup), (_, page) in zip(soups, features):
+        if legacy_check(crawler, url, soup) != crawler._check_affiliate_indicators(url, page):
+            raise SystemExit(f"Result mismatch on {url}")
+
+    backend = "pyahocorasick" if better_affiliate_crawler.ahocorasick is not None else "str.find scans"
+    legacy_ms = time_it(lambda u, s: legacy_check(crawler, u, s), soups, args.rounds)
+    automaton_ms = time_it(crawler._check_affiliate_indicators, features, args.rounds)
+    print(f"{len(soups)} page(s) from {source}, automaton backend: {backend}")
+    print(f"  per-keyword scans: {legacy_ms:.3f} ms/page")
+    print(f"  automaton:         {automaton_ms:.3f} ms/page ({legacy_ms / automaton_ms:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measure the start-up time of better_affiliate_crawler.py and enforce a budget.
+
+Each case runs in a fresh interpreter; the reported time excludes bare
+interpreter start-up. Also checks that importing the module neither loads
+the heavy dependencies nor configures logging. Exits with status 1 when a
+check fails or a case exceeds the budget, so it can gate CI.
+
+Usage: python benchmarks/bench_startup.py [--rounds 5] [--budget-ms 400]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+SCRIPT = os.path.join(ROOT, "better_affiliate_crawler.py")
+
+HEAVY_MODULES = ['aiohttp', 'pandas', 'playwright', 'bs4', 'tqdm', 'requests']
+
+CASES = {
+    'import': [sys.executable, '-c', 'import better_affiliate_crawler'],
+    '--help': [sys.executable, SCRIPT, '--help'],
+}
+
+IMPORT_CHECK = f"""
+import json, logging, sys
+import better_affiliate_crawler
+print(json.dumps({{
+    'heavy': [name for name in {HEAVY_MODULES!r} if name in sys.modules],
+    'log_handlers': len(logging.getLogger().handlers),
+}}))
+"""
+
+
+def time_command(command, rounds):
+    """Median wall time of `command` in ms."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, capture_output=True, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=400, help="Allowed start-up time per case, interpreter excluded (default: 400).")
+    args = parser.parse_args()
+
+    failures = []
+    output = subprocess.run(
+        [sys.executable, '-c', IMPORT_CHECK], cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    state = json.loads(output.strip().splitlines()[-1])
+    print(f"  heavy modules loaded on import: {', '.join(state['heavy']) or 'none'}")
+    print(f"  logging handlers configured on import: {state['log_handlers']}")
+    if state['heavy']:
+        failures.append(f"import loads {', '.join(state['heavy'])}")
+    if state['log_handlers']:
+        failures.append("import configures logging")
+
+    interpreter_ms = time_command([sys.executable, '-c', 'pass'], args.rounds)
+    print(f"  interpreter: {interpreter_ms:8.1f} ms (subtracted below)")
+    for name, command in CASES.items():
+        elapsed_ms = time_command(command, args.rounds) - interpreter_ms
+        print(f"  {name:11s}  {elapsed_ms:8.1f} ms  (budget {args.budget_ms:.0f} ms)")
+        if elapsed_ms > args.budget_ms:
+            failures.append(f"{name} took {elapsed_ms:.0f} ms")
+
+    if failures:
+        raise SystemExit("Start-up check failed: " + "; ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
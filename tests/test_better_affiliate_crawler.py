@@ -0,0 +1,210 @@
+"""Regression tests for better_affiliate_crawler.py.
+
+Usage: python -m pytest tests
+"""
+import asyncio
+import os
+import sys
+from contextlib import asynccontextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pytest
+from aiohttp import web
+
+from better_affiliate_crawler import PARSER_BACKENDS, BetterAffiliateCrawler, DnsCache, HostHealthStore
+
+
+@pytest.fixture
+def crawler(tmp_path, monkeypatch):
+    """A crawler whose progress DB and results file live in a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    return BetterAffiliateCrawler()
+
+
+@asynccontextmanager
+async def local_server(routes):
+    """Serve `routes` ({path: (content_type, body bytes)}) on 127.0.0.1 and yield the base URL."""
+    async def handle(request):
+        content_type, body = routes[request.path]
+        # Set the raw header: web.Response(content_type=...) would add a charset
+        return web.Response(body=body, headers={'Content-Type': content_type})
+
+    app = web.Application()
+    app.router.add_get('/{tail:.*}', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+
+def test_fetch_without_charset(crawler):
+    routes = {
+        '/': ('text/html', "<html><body>Café partners</body></html>".encode('utf-8')),
+        '/latin': ('text/html', '<meta charset="iso-8859-1"><p>Café</p>'.encode('latin-1')),
+        '/robots.txt': ('text/plain', b"User-agent: *\nSitemap: /sitemap.xml\n"),
+    }
+
+    async def fetch_all():
+        async with local_server(routes) as base:
+            try:
+                return [await crawler._fetch(base + path) for path in routes]
+            finally:
+                await crawler.close()
+
+    (status, _, home), (_, _, latin), (_, _, robots) = asyncio.run(fetch_all())
+    assert status == 200
+    assert "Café partners" in home
+    assert "Café" in latin
+    assert "Sitemap: /sitemap.xml" in robots
+
+
+@pytest.mark.parametrize('backend', ['html.parser', 'lxml', 'selectolax'])
+def test_emails_in_adjacent_blocks(crawler, backend):
+    if backend == 'selectolax':
+        pytest.importorskip('selectolax')
+    parse = PARSER_BACKENDS[backend]
+    features = parse(
+        "<html><body><p>Email us</p><p>hello@acme.com</p><div>24</div><div>Mail</div>"
+        "<div>sales@acme.com</div><p>Partners</p></body></html>"
+    )
+    assert crawler._extract_page_emails(features) == {'hello@acme.com', 'sales@acme.com'}
+    # Keyword matching still sees the text as html.parser joins it
+    assert features.text == "Email ushello@acme.com24Mailsales@acme.comPartners"
+
+
+def test_crashed_crawl_is_retried_on_next_run(crawler, monkeypatch):
+    async def crash(tool_name, url):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(crawler, 'process_tool', crash)
+    asyncio.run(crawler.run([('Acme', 'http://127.0.0.1/'), ('Acme Pro', 'http://127.0.0.1/pro')]))
+    assert 'Acme' not in crawler.progress
+    assert 'Acme Pro' not in crawler.progress
+
+
+def test_image_sitemap_keeps_page_loc(crawler):
+    sitemap = (
+        b'<?xml version="1.0" encoding="UTF-8"?>'
+        b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+        b' xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">'
+        b'<url><loc>https://acme.io/partners</loc>'
+        b'<image:image><image:loc>https://acme.io/img/a.png</image:loc></image:image></url>'
+        b'</urlset>'
+    )
+
+    async def stream():
+        async with local_server({'/sitemap.xml': ('application/xml', sitemap)}) as base:
+            urls, candidates = set(), set()
+            try:
+                await crawler._stream_sitemap(base + '/sitemap.xml', urls, candidates)
+            finally:
+                await crawler.close()
+            return urls
+
+    assert asyncio.run(stream()) == {'https://acme.io/partners'}
+
+
+def test_sitemap_failure_keeps_homepage_result(crawler, monkeypatch):
+    async def broken_sitemap(url):
+        raise RuntimeError("unexpected sitemap error")
+
+    monkeypatch.setattr(crawler, '_get_urls_from_sitemap', broken_sitemap)
+    routes = {
+        '/': ('text/html; charset=utf-8', b'<html><body><p>sales@acme.com</p><a href="/about">About</a></body></html>'),
+        '/about': ('text/html; charset=utf-8', b'<html><body>About us</body></html>'),
+    }
+
+    async def crawl():
+        async with local_server(routes) as base:
+            try:
+                return await crawler.crawl_with_requests('Acme', base + '/')
+            finally:
+                await crawler.close()
+
+    result = asyncio.run(crawl())
+    assert result.status_code == '200'
+    assert result.emails == {'sales@acme.com'}
+    assert result.pages_checked == 2
+
+
+def test_sitemap_urls_of_other_sites_are_not_crawled(crawler, monkeypatch):
+    routes = {
+        '/': ('text/html; charset=utf-8', b'<html><body>Home</body></html>'),
+        '/about': ('text/html; charset=utf-8', b'<html><body>About us</body></html>'),
+    }
+    fetched = []
+    fetch = crawler._fetch
+
+    async def recording_fetch(url, *args, **kwargs):
+        fetched.append(url)
+        return await fetch(url, *args, **kwargs)
+
+    monkeypatch.setattr(crawler, '_fetch', recording_fetch)
+
+    async def crawl():
+        async with local_server(routes) as base:
+            async def sitemap(url):
+                return {base + '/about', 'https://other.example/affiliates'}
+
+            monkeypatch.setattr(crawler, '_get_urls_from_sitemap', sitemap)
+            try:
+                await crawler.crawl_with_requests('Acme', base + '/')
+            finally:
+                await crawler.close()
+            return base
+
+    base = asyncio.run(crawl())
+    assert fetched == [base + '/', base + '/about']
+
+
+class StubResolver:
+    """Stands in for aiohttp's resolver: sleeps `delay` s, then answers or raises `error`."""
+
+    def __init__(self, delay=0.0, error=None):
+        self.delay = delay
+        self.error = error
+
+    async def resolve(self, host, port=0, family=0):
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return [{'hostname': host, 'host': '127.0.0.1', 'port': port, 'family': family, 'proto': 0, 'flags': 0}]
+
+    async def close(self):
+        pass
+
+
+def test_dns_timeout_is_not_a_negative_answer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dns_cache = DnsCache(timeout=0.05)
+    dns_cache._resolver = StubResolver(delay=1)
+    host_health = HostHealthStore(str(tmp_path / "hosts.db"))
+    crawler = BetterAffiliateCrawler(dns_cache=dns_cache, host_health=host_health)
+
+    async def pre_resolve_then_retry():
+        result = await crawler._pre_resolve('Acme', 'https://slow.example/')
+        dns_cache._resolver = StubResolver()
+        return result, await dns_cache.resolves('slow.example')
+
+    result, resolves_later = asyncio.run(pre_resolve_then_retry())
+    assert result is None  # handed to the crawl tier, not reported as DNS_ERROR
+    assert host_health.blocked('slow.example') is None
+    assert resolves_later
+    assert dns_cache.stats['timeout'] == 1 and dns_cache.stats['negative'] == 0
+
+
+def test_dns_nxdomain_is_cached():
+    dns_cache = DnsCache()
+    dns_cache._resolver = StubResolver(error=OSError(None, "Domain name not found"))
+
+    async def resolve_twice():
+        return [await dns_cache.resolves('gone.example') for _ in range(2)]
+
+    assert asyncio.run(resolve_twice()) == [False, False]
+    assert dns_cache.stats['negative'] == 1 and dns_cache.stats['hits'] == 1